@@ -28,6 +28,7 @@ class ModuleInstall(ModuleCommand):
         self.force = force
         self.prompt = prompt
         self.sha = sha
+        self._verified_sha = None
 
     def install(self, module):
         if self.repo_type == "modules":
@@ -48,32 +49,29 @@ class ModuleInstall(ModuleCommand):
             log.error("Cannot use '--sha' and '--prompt' at the same time!")
             return False
 
-        # Verify that the provided SHA exists in the repo
-        if self.sha:
+        # Verify that the provided SHA exists in the repo (only once per SHA, it walks the whole history)
+        if self.sha and self.sha != self._verified_sha:
             if not self.modules_repo.sha_exists_on_branch(self.sha):
                 log.error(f"Commit SHA '{self.sha}' doesn't exist in '{self.modules_repo.remote_url}'")
                 return False
+            self._verified_sha = self.sha
+
+        # Get the available modules once, rather than walking the repository for every check
+        avail_modules = self.modules_repo.get_avail_modules()
 
         if module is None:
             module = questionary.autocomplete(
                 "Tool name:",
-                choices=self.modules_repo.get_avail_modules(),
+                choices=avail_modules,
                 style=nf_core.utils.nfcore_question_style,
             ).unsafe_ask()
 
         # Check that the supplied name is an available module
-        if module and module not in self.modules_repo.get_avail_modules():
+        if module not in avail_modules:
             log.error(f"Module '{module}' not found in list of available modules.")
             log.info("Use the command 'nf-core modules list' to view available software")
             return False
 
-        if not self.modules_repo.module_exists(module):
-            warn_msg = (
-                f"Module '{module}' not found in remote '{self.modules_repo.remote_url}' ({self.modules_repo.branch})"
-            )
-            log.warning(warn_msg)
-            return False
-
         current_version = modules_json.get_module_version(
             module, self.modules_repo.remote_url, self.modules_repo.repo_path
         )
@@ -135,9 +133,10 @@ class ModuleInstall(ModuleCommand):
         if not self.install_module_files(module, version, self.modules_repo, install_folder):
             return False
 
-        # Print include statement
-        module_name = "_".join(module.upper().split("/"))
-        log.info(f"Include statement: include {{ {module_name} }} from '.{os.path.join(install_folder, module)}/main'")
+        # Print include statement (only build it if it will actually be shown)
+        if log.isEnabledFor(logging.INFO):
+            module_name = module.upper().replace("/", "_")
+            log.info(f"Include statement: include {{ {module_name} }} from '.{module_dir}/main'")
 
         # Update module.json with newly installed module
         modules_json.update(self.modules_repo, module, version)
@@ -80,11 +80,12 @@ class ModuleLint(ModuleCommand):
         self.warned = []
         self.failed = []
         self.lint_tests = self.get_all_lint_tests(self.repo_type == "pipeline")
+        self.modules_json = None
 
         if self.repo_type == "pipeline":
-            modules_json = ModulesJson(self.dir)
-            modules_json.check_up_to_date()
-            all_pipeline_modules = modules_json.get_all_modules()
+            self.modules_json = ModulesJson(self.dir)
+            self.modules_json.check_up_to_date()
+            all_pipeline_modules = self.modules_json.get_all_modules()
             if self.modules_repo.remote_url in all_pipeline_modules:
                 module_dir = Path(self.dir, "modules", "nf-core")
                 self.all_remote_modules = [
@@ -112,7 +113,6 @@ class ModuleLint(ModuleCommand):
                 raise LookupError("No modules in 'modules' directory")
 
         self.lint_config = None
-        self.modules_json = None
 
     @staticmethod
     def get_all_lint_tests(is_pipeline):
@@ -226,8 +226,10 @@ class ModuleLint(ModuleCommand):
 
     def set_up_pipeline_files(self):
         self.load_lint_config()
-        self.modules_json = ModulesJson(self.dir)
-        self.modules_json.load()
+        # The 'modules.json' was already loaded and checked when the object was initialised
+        if self.modules_json is None:
+            self.modules_json = ModulesJson(self.dir)
+            self.modules_json.load()
 
         # Only continue if a lint config has been loaded
         if self.lint_config:
@@ -16,6 +16,17 @@ from nf_core.modules.modules_differ import ModulesDiffer
 
 log = logging.getLogger(__name__)
 
+# Patterns marking the start of each section of a module's main.nf file
+_PROCESS_RE = re.compile(r"^\s*process\s*\w*\s*{")
+_INPUT_RE = re.compile(r"input\s*:")
+_OUTPUT_RE = re.compile(r"output\s*:")
+_WHEN_RE = re.compile(r"when\s*:")
+_SCRIPT_RE = re.compile(r"script\s*:")
+_SHELL_RE = re.compile(r"shell\s*:")
+
+# The tag of a container: the run of tag characters right before a closing quote
+_CONTAINER_TAG_RE = re.compile(r"([A-Za-z\d\-_.]+)['\"]")
+
 
 def main_nf(module_lint_object, module, fix_version, progress_bar):
     """
@@ -81,21 +92,22 @@ def main_nf(module_lint_object, module, fix_version, progress_bar):
     shell_lines = []
     when_lines = []
     for l in lines:
-        if re.search(r"^\s*process\s*\w*\s*{", l) and state == "module":
+        # Check the (cheap) current state before trying to match a section header
+        if state == "module" and _PROCESS_RE.search(l):
             state = "process"
-        if re.search(r"input\s*:", l) and state in ["process"]:
+        if state in ["process"] and _INPUT_RE.search(l):
             state = "input"
             continue
-        if re.search(r"output\s*:", l) and state in ["input", "process"]:
+        if state in ["input", "process"] and _OUTPUT_RE.search(l):
             state = "output"
             continue
-        if re.search(r"when\s*:", l) and state in ["input", "output", "process"]:
+        if state in ["input", "output", "process"] and _WHEN_RE.search(l):
             state = "when"
             continue
-        if re.search(r"script\s*:", l) and state in ["input", "output", "when", "process"]:
+        if state in ["input", "output", "when", "process"] and _SCRIPT_RE.search(l):
             state = "script"
             continue
-        if re.search(r"shell\s*:", l) and state in ["input", "output", "when", "process"]:
+        if state in ["input", "output", "when", "process"] and _SHELL_RE.search(l):
             state = "shell"
             continue
 
@@ -259,20 +271,19 @@ def check_process_section(self, lines, fix_version, progress_bar):
         if _container_type(l) == "bioconda":
             bioconda_packages = [b for b in l.split() if "bioconda::" in b]
         l = l.strip(" '\"")
-        if _container_type(l) == "singularity":
+        container_type = _container_type(l)
+        if container_type == "singularity":
             # e.g. "https://containers.biocontainers.pro/s3/SingImgsRepo/biocontainers/v1.2.0_cv1/biocontainers_v1.2.0_cv1.img' :" -> v1.2.0_cv1
             # e.g. "https://depot.galaxyproject.org/singularity/fastqc:0.11.9--0' :" -> 0.11.9--0
-            match = re.search(r"(?:/)?(?:biocontainers_)?(?::)?([A-Za-z\d\-_.]+?)(?:\.img)?['\"]", l)
-            if match is not None:
-                singularity_tag = match.group(1)
+            singularity_tag = _singularity_tag(l)
+            if singularity_tag is not None:
                 self.passed.append(("singularity_tag", f"Found singularity tag: {singularity_tag}", self.main_nf))
             else:
                 self.failed.append(("singularity_tag", "Unable to parse singularity tag", self.main_nf))
-                singularity_tag = None
-        if _container_type(l) == "docker":
+        if container_type == "docker":
             # e.g. "quay.io/biocontainers/krona:2.7.1--pl526_5' }" -> 2.7.1--pl526_5
             # e.g. "biocontainers/biocontainers:v1.2.0_cv1' }" -> v1.2.0_cv1
-            match = re.search(r"(?:[/])?(?::)?([A-Za-z\d\-_.]+)['\"]", l)
+            match = _CONTAINER_TAG_RE.search(l)
             if match is not None:
                 docker_tag = match.group(1)
                 self.passed.append(("docker_tag", f"Found docker tag: {docker_tag}", self.main_nf))
@@ -462,6 +473,25 @@ def _get_build(response):
     return sorted(build_times, key=lambda tup: tup[0], reverse=True)[0][1]
 
 
+def _singularity_tag(line):
+    """
+    Returns the tag of a singularity container URL, or None if it can't be parsed.
+
+    The tag is the run of tag characters just before the closing quote, without
+    a 'biocontainers_' prefix (unless it directly follows a ':') or an '.img' suffix.
+    """
+    match = _CONTAINER_TAG_RE.search(line)
+    if match is None:
+        return None
+    tag = match.group(1)
+    prefix, suffix = "biocontainers_", ".img"
+    if tag.startswith(prefix) and len(tag) > len(prefix) and line[match.start() - 1 : match.start()] != ":":
+        tag = tag[len(prefix) :]
+    if tag.endswith(suffix) and len(tag) > len(suffix):
+        tag = tag[: -len(suffix)]
+    return tag
+
+
 def _container_type(line):
     """Returns the container type of a build."""
     if re.search("bioconda::", line):
@@ -1,3 +1,4 @@
+import concurrent.futures
 import copy
 import datetime
 import json
@@ -213,10 +214,14 @@ class ModulesJson:
             (dict[str, dict[str, str]]): The module.json entries for the modules
                                          from the repository
         """
-        default_modules_repo = nf_core.modules.modules_repo.ModulesRepo(remote_url=remote_url)
+        # Get the branches present in the repository in the background. They are only needed if a
+        # module can't be found in the default branch, so the lookup overlaps with setting up the repo
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            available_branches = pool.submit(nf_core.modules.modules_repo.ModulesRepo.get_remote_branches, remote_url)
+            default_modules_repo = nf_core.modules.modules_repo.ModulesRepo(remote_url=remote_url)
         repo_path = self.modules_dir / install_dir
-        # Get the branches present in the repository, as well as the default branch
-        available_branches = nf_core.modules.modules_repo.ModulesRepo.get_remote_branches(remote_url)
+        # Keep one ModulesRepo object per branch, so they are only set up once
+        branch_repos = {default_modules_repo.branch: default_modules_repo}
         sb_local = []
         dead_modules = []
         repo_entry = {}
@@ -242,7 +247,7 @@ class ModulesJson:
                 if correct_commit_sha is None:
                     log.info(f"Was unable to find matching module files in the {modules_repo.branch} branch.")
                     choices = [{"name": "No", "value": False}] + [
-                        {"name": branch, "value": branch} for branch in (available_branches - tried_branches)
+                        {"name": branch, "value": branch} for branch in (available_branches.result() - tried_branches)
                     ]
                     branch = questionary.select(
                         f"Was the module '{module}' installed from a different branch in the remote?\nSelect 'No' for a local module",
@@ -263,10 +268,12 @@ class ModulesJson:
                         else:
                             dead_modules.append(module)
                         break
-                    # Create a new modules repo with the selected branch, and retry find the sha
-                    modules_repo = nf_core.modules.modules_repo.ModulesRepo(
-                        remote_url=remote_url, branch=branch, no_pull=True, hide_progress=True
-                    )
+                    # Use a modules repo with the selected branch, and retry find the sha
+                    if branch not in branch_repos:
+                        branch_repos[branch] = nf_core.modules.modules_repo.ModulesRepo(
+                            remote_url=remote_url, branch=branch, no_pull=True, hide_progress=True
+                        )
+                    modules_repo = branch_repos[branch]
                 else:
                     found_sha = True
                     break
@@ -338,17 +345,18 @@ class ModulesJson:
         """
         # Add all modules from modules.json to missing_installation
         missing_installation = copy.deepcopy(self.modules_json["repos"])
-        # Obtain the path of all installed modules
-        dirs = [
-            Path(dir_name).relative_to(self.modules_dir)
-            for dir_name, _, file_names in os.walk(self.modules_dir)
-            if "main.nf" in file_names and not str(Path(dir_name).relative_to(self.modules_dir)).startswith("local")
-        ]
+        # Obtain the path components of all installed modules
+        dirs = []
+        for dir_name, _, file_names in os.walk(self.modules_dir):
+            if "main.nf" in file_names:
+                rel_dir = Path(dir_name).relative_to(self.modules_dir)
+                if not str(rel_dir).startswith("local"):
+                    dirs.append(rel_dir.parts)
         untracked_dirs = []
-        for dir in dirs:
+        for dir_parts in dirs:
             # Check if the modules directory exists in modules.json
-            install_dir = dir.parts[0]
-            module = str(Path(*dir.parts[1:]))
+            install_dir = dir_parts[0]
+            module = str(Path(*dir_parts[1:]))
             module_in_file = False
             git_url = None
             for repo in missing_installation:
@@ -410,6 +418,7 @@ class ModulesJson:
         Returns:
             ([ str ]): List of modules that we failed to install
         """
+        # Group the modules by branch and commit, so that each commit is only checked out once
         branches_and_mods = {}
         failed_to_install = []
         for module, module_entry in module_entries.items():
@@ -418,18 +427,17 @@ class ModulesJson:
             else:
                 branch = module_entry["branch"]
                 sha = module_entry["git_sha"]
-                if branch not in branches_and_mods:
-                    branches_and_mods[branch] = []
-                branches_and_mods[branch].append((module, sha))
+                branches_and_mods.setdefault(branch, {}).setdefault(sha, []).append(module)
 
-        for branch, modules in branches_and_mods.items():
+        for branch, shas_and_mods in branches_and_mods.items():
             try:
                 modules_repo = nf_core.modules.modules_repo.ModulesRepo(remote_url=remote_url, branch=branch)
             except LookupError as e:
                 log.error(e)
-                failed_to_install.extend(modules)
-            for module, sha in modules:
-                if not modules_repo.install_module(module, self.modules_dir / install_dir, sha):
+                failed_to_install.extend(module for modules in shas_and_mods.values() for module in modules)
+                continue
+            for sha, modules in shas_and_mods.items():
+                for module in modules_repo.install_modules(modules, self.modules_dir / install_dir, sha):
                     log.warning(
                         f"Could not install module '{Path(self.modules_dir, install_dir, module)}' - removing from modules.json"
                     )
@@ -313,23 +313,42 @@ class ModulesRepo(object):
         Returns:
             (bool): Whether the operation was successful or not
         """
+        return len(self.install_modules([module_name], install_dir, commit)) == 0
+
+    def install_modules(self, module_names, install_dir, commit):
+        """
+        Install the files of several modules into a pipeline at the given commit.
+        The repository is only checked out once for all of the modules.
+
+        Args:
+            module_names ([ str ]): The names of the modules
+            install_dir (str): The path where the modules should be installed
+            commit (str): The git SHA for the version of the modules to be installed
+
+        Returns:
+            ([ str ]): The modules that could not be installed
+        """
         # Check out the repository at the requested ref
         try:
             self.checkout(commit)
         except git.GitCommandError:
-            return False
-
-        # Check if the module exists in the branch
-        if not self.module_exists(module_name, checkout=False):
-            log.error(f"The requested module does not exists in the branch '{self.branch}' of {self.remote_url}'")
-            return False
+            return list(module_names)
+
+        avail_modules = self.get_avail_modules(checkout=False)
+        failed_to_install = []
+        for module_name in module_names:
+            # Check if the module exists in the branch
+            if module_name not in avail_modules:
+                log.error(f"The requested module does not exists in the branch '{self.branch}' of {self.remote_url}'")
+                failed_to_install.append(module_name)
+                continue
 
-        # Copy the files from the repo to the install folder
-        shutil.copytree(self.get_module_dir(module_name), Path(install_dir, module_name))
+            # Copy the files from the repo to the install folder
+            shutil.copytree(self.get_module_dir(module_name), Path(install_dir, module_name))
 
         # Switch back to the tip of the branch
         self.checkout_branch()
-        return True
+        return failed_to_install
 
     def module_files_identical(self, module_name, base_path, commit):
         """
@@ -127,10 +127,10 @@ class ModulesTestYmlBuilder(ModuleCommand):
         """Find the test workflow entry points from main.nf"""
         log.info(f"Looking for test workflow entry points: '{self.module_test_main}'")
         with open(self.module_test_main, "r") as fh:
-            for line in fh:
-                match = re.match(r"workflow\s+(\S+)\s+{", line)
-                if match:
-                    self.entry_points.append(match.group(1))
+            contents = fh.read()
+        # Scan the whole file at once, keeping each match within a single line
+        for match in re.finditer(r"^workflow[^\S\n]+(\S+)[^\S\n]+{", contents, re.MULTILINE):
+            self.entry_points.append(match.group(1))
         if len(self.entry_points) == 0:
             raise UserWarning("No workflow entry points found in 'self.module_test_main'")
 
@@ -132,100 +132,109 @@ class ModuleUpdate(ModuleCommand):
         # and do the requested action on them
         exit_value = True
         all_patches_successful = True
-        for modules_repo, module, sha, patch_relpath in modules_info:
-            module_fullname = str(Path("modules", modules_repo.repo_path, module))
-            # Are we updating the files in place or not?
-            dry_run = self.show_diff or self.save_diff_fn
-
-            current_version = self.modules_json.get_module_version(
-                module, modules_repo.remote_url, modules_repo.repo_path
-            )
-
-            # Set the temporary installation folder
-            install_tmp_dir = Path(tempfile.mkdtemp())
-            module_install_dir = install_tmp_dir / module
-
-            # Compute the module directory
-            module_dir = os.path.join(self.dir, "modules", modules_repo.repo_path, module)
+        # Keep track of the updates that are actually applied, to write them all to 'modules.json' at once
+        applied_updates = []
+        try:
+            for modules_repo, module, sha, patch_relpath in modules_info:
+                module_fullname = str(Path("modules", modules_repo.repo_path, module))
+                # Are we updating the files in place or not?
+                dry_run = self.show_diff or self.save_diff_fn
 
-            if sha is not None:
-                version = sha
-            elif self.prompt:
-                version = nf_core.modules.module_utils.prompt_module_version_sha(
-                    module, modules_repo=modules_repo, installed_sha=current_version
+                current_version = self.modules_json.get_module_version(
+                    module, modules_repo.remote_url, modules_repo.repo_path
                 )
-            else:
-                version = modules_repo.get_latest_module_version(module)
 
-            if current_version is not None and not self.force:
-                if current_version == version:
-                    if self.sha or self.prompt:
-                        log.info(f"'{module_fullname}' is already installed at {version}")
-                    else:
-                        log.info(f"'{module_fullname}' is already up to date")
-                    continue
+                # Set the temporary installation folder
+                install_tmp_dir = Path(tempfile.mkdtemp())
+                module_install_dir = install_tmp_dir / module
 
-            # Download module files
-            if not self.install_module_files(module, version, modules_repo, install_tmp_dir):
-                exit_value = False
-                continue
+                # Compute the module directory
+                module_dir = os.path.join(self.dir, "modules", modules_repo.repo_path, module)
 
-            if patch_relpath is not None:
-                patch_successful = self.try_apply_patch(
-                    module, modules_repo.repo_path, patch_relpath, module_dir, module_install_dir
-                )
-                if patch_successful:
-                    log.info(f"Module '{module_fullname}' patched successfully")
+                if sha is not None:
+                    version = sha
+                elif self.prompt:
+                    version = nf_core.modules.module_utils.prompt_module_version_sha(
+                        module, modules_repo=modules_repo, installed_sha=current_version
+                    )
                 else:
-                    log.warning(f"Failed to patch module '{module_fullname}'. Will proceed with unpatched files.")
-                all_patches_successful &= patch_successful
+                    version = modules_repo.get_latest_module_version(module)
+
+                if current_version is not None and not self.force:
+                    if current_version == version:
+                        if self.sha or self.prompt:
+                            log.info(f"'{module_fullname}' is already installed at {version}")
+                        else:
+                            log.info(f"'{module_fullname}' is already up to date")
+                        continue
+
+                # Download module files
+                if not self.install_module_files(module, version, modules_repo, install_tmp_dir):
+                    exit_value = False
+                    continue
 
-            if dry_run:
                 if patch_relpath is not None:
+                    patch_successful = self.try_apply_patch(
+                        module, modules_repo.repo_path, patch_relpath, module_dir, module_install_dir
+                    )
                     if patch_successful:
-                        log.info("Current installation is compared against patched version in remote.")
+                        log.info(f"Module '{module_fullname}' patched successfully")
                     else:
-                        log.warning("Current installation is compared against unpatched version in remote.")
-                # Compute the diffs for the module
-                if self.save_diff_fn:
-                    log.info(f"Writing diff file for module '{module_fullname}' to '{self.save_diff_fn}'")
-                    ModulesDiffer.write_diff_file(
-                        self.save_diff_fn,
-                        module,
-                        modules_repo.repo_path,
-                        module_dir,
-                        module_install_dir,
-                        current_version,
-                        version,
-                        dsp_from_dir=module_dir,
-                        dsp_to_dir=module_dir,
-                    )
+                        log.warning(f"Failed to patch module '{module_fullname}'. Will proceed with unpatched files.")
+                    all_patches_successful &= patch_successful
+
+                if dry_run:
+                    if patch_relpath is not None:
+                        if patch_successful:
+                            log.info("Current installation is compared against patched version in remote.")
+                        else:
+                            log.warning("Current installation is compared against unpatched version in remote.")
+                    # Compute the diffs for the module
+                    if self.save_diff_fn:
+                        log.info(f"Writing diff file for module '{module_fullname}' to '{self.save_diff_fn}'")
+                        ModulesDiffer.write_diff_file(
+                            self.save_diff_fn,
+                            module,
+                            modules_repo.repo_path,
+                            module_dir,
+                            module_install_dir,
+                            current_version,
+                            version,
+                            dsp_from_dir=module_dir,
+                            dsp_to_dir=module_dir,
+                        )
 
-                elif self.show_diff:
-                    ModulesDiffer.print_diff(
-                        module,
-                        modules_repo.repo_path,
-                        module_dir,
-                        module_install_dir,
-                        current_version,
-                        version,
-                        dsp_from_dir=module_dir,
-                        dsp_to_dir=module_dir,
-                    )
+                    elif self.show_diff:
+                        ModulesDiffer.print_diff(
+                            module,
+                            modules_repo.repo_path,
+                            module_dir,
+                            module_install_dir,
+                            current_version,
+                            version,
+                            dsp_from_dir=module_dir,
+                            dsp_to_dir=module_dir,
+                        )
 
-                    # Ask the user if they want to install the module
-                    dry_run = not questionary.confirm(
-                        f"Update module '{module}'?", default=False, style=nf_core.utils.nfcore_question_style
-                    ).unsafe_ask()
+                        # Ask the user if they want to install the module
+                        dry_run = not questionary.confirm(
+                            f"Update module '{module}'?", default=False, style=nf_core.utils.nfcore_question_style
+                        ).unsafe_ask()
 
-            if not dry_run:
-                # Clear the module directory and move the installed files there
-                self.move_files_from_tmp_dir(module, install_tmp_dir, modules_repo.repo_path, version)
-                # Update modules.json with newly installed module
-                self.modules_json.update(modules_repo, module, version)
-            else:
-                # Don't save to a file, just iteratively update the variable
+                if not dry_run:
+                    # Clear the module directory and move the installed files there
+                    self.move_files_from_tmp_dir(module, install_tmp_dir, modules_repo.repo_path, version)
+                    applied_updates.append((modules_repo, module, version))
+                # Update the variable for the diff, the file is written after the loop
                 self.modules_json.update(modules_repo, module, version, write_file=False)
+        finally:
+            # Record the modules that were already replaced, even if a later module failed or was interrupted
+            if applied_updates:
+                # Only write the modules that were updated, not the ones that were previewed and declined
+                applied_modules_json = ModulesJson(self.dir)
+                for modules_repo, module, version in applied_updates:
+                    applied_modules_json.update(modules_repo, module, version, write_file=False)
+                applied_modules_json.dump()
 
         if self.save_diff_fn:
             # Write the modules.json diff to the file
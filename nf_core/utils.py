@@ -965,13 +965,17 @@ def load_tools_config(dir="."):
 
 
 def sort_dictionary(d):
-    """Sorts a nested dictionary recursively"""
+    """Sorts a nested dictionary, using an explicit stack instead of recursion"""
     result = {}
-    for k, v in sorted(d.items()):
-        if isinstance(v, dict):
-            result[k] = sort_dictionary(v)
-        else:
-            result[k] = v
+    stack = [(d, result)]
+    while stack:
+        unsorted, sorted_dict = stack.pop()
+        for k, v in sorted(unsorted.items()):
+            if isinstance(v, dict):
+                sorted_dict[k] = {}
+                stack.append((v, sorted_dict[k]))
+            else:
+                sorted_dict[k] = v
     return result
 
 
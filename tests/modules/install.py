@@ -4,11 +4,13 @@ import pytest
 
 from nf_core.modules.install import ModuleInstall
 from nf_core.modules.modules_json import ModulesJson
+from nf_core.modules.remove import ModuleRemove
 
 from ..utils import (
     GITLAB_BRANCH_TEST_BRANCH,
     GITLAB_REPO,
     GITLAB_URL,
+    set_wd,
     with_temporary_folder,
 )
 
@@ -30,7 +32,9 @@ def test_modules_install_emptypipeline(self, tmpdir):
 
 def test_modules_install_nomodule(self):
     """Test installing a module - unrecognised module given"""
-    assert self.mods_install.install("foo") is False
+    with self.assertLogs("nf_core.modules.install", level="INFO") as log_output:
+        assert self.mods_install.install("foo") is False
+    assert "ERROR:nf_core.modules.install:Module 'foo' not found in list of available modules." in log_output.output
 
 
 def test_modules_install_trimgalore(self):
@@ -46,6 +50,30 @@ def test_modules_install_trimgalore_twice(self):
     assert self.mods_install.install("trimgalore") is True
 
 
+def test_modules_install_after_remove(self):
+    """Test that installing picks up changes made to the pipeline since the previous install"""
+    assert self.mods_install.install("trimgalore") is True
+    assert ModuleRemove(self.pipeline_dir).remove("trimgalore") is True
+    assert self.mods_install.install("fastqc") is True
+
+    modules_json = ModulesJson(self.pipeline_dir)
+    remote_url = self.mods_install.modules_repo.remote_url
+    assert modules_json.module_present("fastqc", remote_url, "nf-core")
+    assert not modules_json.module_present("trimgalore", remote_url, "nf-core")
+
+
+def test_modules_install_include_statement(self):
+    """Test the include statement printed when installing from within the pipeline directory"""
+    with set_wd(self.pipeline_dir):
+        install_obj = ModuleInstall(".", prompt=False, force=True)
+        with self.assertLogs("nf_core.modules.install", level="INFO") as log_output:
+            assert install_obj.install("trimgalore") is True
+    assert (
+        "INFO:nf_core.modules.install:Include statement: include { TRIMGALORE } from '../modules/nf-core/trimgalore/main'"
+        in log_output.output
+    )
+
+
 def test_modules_install_from_gitlab(self):
     """Test installing a module from GitLab"""
     assert self.mods_install_gitlab.install("fastqc") is True
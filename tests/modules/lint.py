@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 import nf_core.modules
+from nf_core.modules.lint.main_nf import _singularity_tag
 
 from ..utils import GITLAB_URL, set_wd
 from .patch import BISMARK_ALIGN, CORRECT_SHA, PATCH_BRANCH, REPO_NAME, modify_main_nf
@@ -87,3 +88,15 @@ def test_modules_lint_patched_modules(self):
     assert len(module_lint.failed) == 0
     assert len(module_lint.passed) > 0
     assert len(module_lint.warned) >= 0
+
+
+def test_modules_lint_singularity_tag(self):
+    """Test parsing the tag from singularity container URLs"""
+    assert (
+        _singularity_tag(
+            "https://containers.biocontainers.pro/s3/SingImgsRepo/biocontainers/v1.2.0_cv1/biocontainers_v1.2.0_cv1.img' :"
+        )
+        == "v1.2.0_cv1"
+    )
+    assert _singularity_tag("https://depot.galaxyproject.org/singularity/fastqc:0.11.9--0' :") == "0.11.9--0"
+    assert _singularity_tag("https://depot.galaxyproject.org/singularity/fastqc:0.11.9--0") is None
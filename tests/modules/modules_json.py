@@ -147,6 +147,28 @@ def test_mod_json_up_to_date_module_removed(self):
         assert os.path.exists(os.path.join(fastqc_path, f))
 
 
+def test_mod_json_up_to_date_all_modules_removed(self):
+    """
+    Reinstall all the modules of a repository that have an
+    entry in the modules.json but are missing in the pipeline
+    """
+    mod_json_obj = ModulesJson(self.pipeline_dir)
+    modules = [module for _, module in mod_json_obj.get_all_modules()[NF_CORE_MODULES_REMOTE]]
+    modules_dir = os.path.join(self.pipeline_dir, "modules", NF_CORE_MODULES_NAME)
+    for module in modules:
+        shutil.rmtree(os.path.join(modules_dir, module))
+
+    # Check that the modules.json file is up to date, and reinstall the modules
+    mod_json_obj.check_up_to_date()
+
+    # Check that all the modules have been reinstalled
+    for module in modules:
+        assert os.path.exists(os.path.join(modules_dir, module, "main.nf"))
+    assert mod_json_obj.get_modules_json()["repos"][NF_CORE_MODULES_REMOTE]["modules"]["nf-core"].keys() == set(
+        modules
+    )
+
+
 def test_mod_json_up_to_date_reinstall_fails(self):
     """
     Try reinstalling a module where the git_sha is invalid
@@ -2,7 +2,9 @@ import filecmp
 import os
 import shutil
 import tempfile
+from unittest import mock
 
+import pytest
 import yaml
 
 import nf_core.utils
@@ -276,6 +278,69 @@ def test_update_different_branch_mix_modules_branch_test(self):
     assert modules_json.get_module_version("multiqc", GITLAB_URL, GITLAB_REPO) == GITLAB_BRANCH_TEST_NEW_SHA
 
 
+def test_update_show_diff_accept_then_decline(self):
+    """Only the modules accepted in the diff preview should be updated in the modules.json"""
+    assert self.mods_install_gitlab_old.install("fastp")
+    assert self.mods_install_gitlab_old.install("multiqc")
+
+    # Accept the first module that is previewed, decline the second one
+    prompted_modules = []
+
+    def confirm(message, **kwargs):
+        prompted_modules.append(message.split("'")[1])
+        return mock.Mock(unsafe_ask=mock.Mock(return_value=len(prompted_modules) == 1))
+
+    update_obj = ModuleUpdate(
+        self.pipeline_dir,
+        update_all=True,
+        show_diff=True,
+        remote_url=GITLAB_URL,
+        branch=GITLAB_BRANCH_TEST_BRANCH,
+        sha=GITLAB_BRANCH_TEST_NEW_SHA,
+    )
+    with mock.patch("questionary.confirm", side_effect=confirm):
+        assert update_obj.update() is True
+    assert sorted(prompted_modules) == ["fastp", "multiqc"]
+    accepted, declined = prompted_modules
+
+    modules_json = ModulesJson(self.pipeline_dir)
+    assert modules_json.get_module_version(accepted, GITLAB_URL, GITLAB_REPO) == GITLAB_BRANCH_TEST_NEW_SHA
+    assert modules_json.get_module_version(declined, GITLAB_URL, GITLAB_REPO) == GITLAB_BRANCH_TEST_OLD_SHA
+
+
+def test_update_show_diff_interrupted(self):
+    """Modules updated before an interruption should still be recorded in the modules.json"""
+    assert self.mods_install_gitlab_old.install("fastp")
+    assert self.mods_install_gitlab_old.install("multiqc")
+
+    # Accept the first module that is previewed, interrupt at the second prompt
+    prompted_modules = []
+
+    def confirm(message, **kwargs):
+        prompted_modules.append(message.split("'")[1])
+        if len(prompted_modules) == 1:
+            return mock.Mock(unsafe_ask=mock.Mock(return_value=True))
+        return mock.Mock(unsafe_ask=mock.Mock(side_effect=KeyboardInterrupt))
+
+    update_obj = ModuleUpdate(
+        self.pipeline_dir,
+        update_all=True,
+        show_diff=True,
+        remote_url=GITLAB_URL,
+        branch=GITLAB_BRANCH_TEST_BRANCH,
+        sha=GITLAB_BRANCH_TEST_NEW_SHA,
+    )
+    with mock.patch("questionary.confirm", side_effect=confirm):
+        with pytest.raises(KeyboardInterrupt):
+            update_obj.update()
+    assert sorted(prompted_modules) == ["fastp", "multiqc"]
+    accepted, interrupted = prompted_modules
+
+    modules_json = ModulesJson(self.pipeline_dir)
+    assert modules_json.get_module_version(accepted, GITLAB_URL, GITLAB_REPO) == GITLAB_BRANCH_TEST_NEW_SHA
+    assert modules_json.get_module_version(interrupted, GITLAB_URL, GITLAB_REPO) == GITLAB_BRANCH_TEST_OLD_SHA
+
+
 def cmp_module(dir1, dir2):
     """Compare two versions of the same module"""
     files = ["main.nf", "meta.yml"]
@@ -122,10 +122,12 @@ class TestModules(unittest.TestCase):
         test_modules_test_file_dict,
     )
     from .modules.install import (
+        test_modules_install_after_remove,
         test_modules_install_different_branch_fail,
         test_modules_install_different_branch_succeed,
         test_modules_install_emptypipeline,
         test_modules_install_from_gitlab,
+        test_modules_install_include_statement,
         test_modules_install_nomodule,
         test_modules_install_nopipeline,
         test_modules_install_trimgalore,
@@ -137,6 +139,7 @@ class TestModules(unittest.TestCase):
         test_modules_lint_new_modules,
         test_modules_lint_no_gitlab,
         test_modules_lint_patched_modules,
+        test_modules_lint_singularity_tag,
         test_modules_lint_trimgalore,
     )
     from .modules.list import (
@@ -160,6 +163,7 @@ class TestModules(unittest.TestCase):
         test_mod_json_module_present,
         test_mod_json_repo_present,
         test_mod_json_up_to_date,
+        test_mod_json_up_to_date_all_modules_removed,
         test_mod_json_up_to_date_module_removed,
         test_mod_json_up_to_date_reinstall_fails,
         test_mod_json_update,
@@ -186,6 +190,8 @@ class TestModules(unittest.TestCase):
         test_update_different_branch_mix_modules_branch_test,
         test_update_different_branch_mixed_modules_main,
         test_update_different_branch_single_module,
+        test_update_show_diff_accept_then_decline,
+        test_update_show_diff_interrupted,
         test_update_with_config_dont_update,
         test_update_with_config_fix_all,
         test_update_with_config_fixed_version,
@@ -208,3 +208,27 @@ def test_validate_file_md5():
         nf_core.utils.validate_file_md5(test_file, different_md5)
     with pytest.raises(ValueError):
         nf_core.utils.validate_file_md5(test_file, non_hex_string)
+
+
+def test_sort_dictionary():
+    """Test that nested dictionaries are sorted at every level"""
+    d = {"b": {"d": 1, "c": {"f": 2, "e": 3}}, "a": [3, 1]}
+    sorted_d = nf_core.utils.sort_dictionary(d)
+    assert sorted_d == d
+    assert list(sorted_d) == ["a", "b"]
+    assert list(sorted_d["b"]) == ["c", "d"]
+    assert list(sorted_d["b"]["c"]) == ["e", "f"]
+    assert sorted_d["a"] == [3, 1]
+
+    # Deeply nested dictionaries should not hit the recursion limit
+    deep = {}
+    node = deep
+    for _ in range(5000):
+        node["x"] = {}
+        node = node["x"]
+    node = nf_core.utils.sort_dictionary(deep)
+    depth = 0
+    while node:
+        node = node["x"]
+        depth += 1
+    assert depth == 5000